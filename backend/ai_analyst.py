@@ -1,25 +1,61 @@
 import pandas as pd
 import json
-from typing import Dict, Any, Optional
-from openai import OpenAI
-from config import settings
-import plotly.express as px
-import plotly.graph_objects as go
+import threading
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from config import get_settings
 import re
-import httpx
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 class AIDataAnalyst:
     def __init__(self):
-        # Create httpx client with SSL verification disabled (Windows SSL fix)
-        http_client = httpx.Client(verify=False)
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=settings.openrouter_api_key,
-            http_client=http_client
-        )
+        # The OpenAI client and Plotly are loaded on first use (or by warm_up) to keep startup fast
+        self._client: Optional["OpenAI"] = None
+        self._client_lock = threading.Lock()
         self.df: Optional[pd.DataFrame] = None
         self.df_info: Optional[Dict[str, Any]] = None
     
+    @property
+    def client(self) -> "OpenAI":
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import httpx
+                    from openai import OpenAI
+
+                    # Create httpx client with SSL verification disabled (Windows SSL fix)
+                    http_client = httpx.Client(verify=False)
+                    self._client = OpenAI(
+                        base_url="https://openrouter.ai/api/v1",
+                        api_key=get_settings().openrouter_api_key,
+                        http_client=http_client
+                    )
+        return self._client
+    
+    def warm_up(self) -> Dict[str, Any]:
+        """Load Plotly, build the OpenAI client and open a connection to the LLM API."""
+        steps = {}
+        
+        try:
+            import plotly.express as px
+            # The first figure loads Plotly's templates and validators
+            px.bar(pd.DataFrame({"x": [0], "y": [0]}), x="x", y="y").to_json()
+            steps["plotly"] = "ok"
+        except Exception as e:
+            steps["plotly"] = f"failed: {str(e)}"
+        
+        try:
+            # GET /key is small and requires auth, so it checks the API key and opens the
+            # pooled HTTPS connection reused by queries. Bounded so a slow or unreachable
+            # API can't stall startup/shutdown.
+            self.client.with_options(timeout=5.0, max_retries=0).get("/key", cast_to=object)
+            steps["llm_api_key"] = "ok"
+        except Exception as e:
+            steps["llm_api_key"] = f"failed: {str(e)}"
+        
+        return steps
+    
     def set_dataframe(self, df: pd.DataFrame, df_info: Dict[str, Any]):
         self.df = df
         self.df_info = df_info
@@ -31,7 +67,7 @@ class AIDataAnalyst:
         system_prompt = self._build_system_prompt()
         
         try:
-            model_to_use = settings.openrouter_model
+            model_to_use = get_settings().openrouter_model
             print(f"[DEBUG] Using OpenRouter model: {model_to_use}")
             
             # Combine system prompt with user query for models that don't support system messages
@@ -185,6 +221,8 @@ Example queries and responses:
             if not viz_type or viz_type == "none":
                 return None
             
+            import plotly.express as px
+            
             df_viz = self.df.copy()
             
             if viz_type == "bar":
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+import time
+import requests
+
+PORT = 8001
+BASE_URL = f"http://localhost:{PORT}"
+IMPORTTIME_LOG = "importtime.log"
+SERVER_LOG = "benchmark_server.log"
+
+print("=" * 60)
+print("STARTUP BENCHMARK")
+print("=" * 60)
+
+# Step 1: Import-time profile of the app module
+print("\n[1/2] Profiling imports (python -X importtime -c 'import main')...")
+start = time.perf_counter()
+proc = subprocess.run(
+    [sys.executable, "-X", "importtime", "-c", "import main"],
+    capture_output=True,
+    text=True
+)
+elapsed = time.perf_counter() - start
+with open(IMPORTTIME_LOG, "w") as f:
+    f.write(proc.stderr)
+
+if proc.returncode != 0:
+    print(f"   ✗ Import failed, see {IMPORTTIME_LOG}")
+    exit(1)
+
+# Lines look like: "import time:   self [us] |  cumulative | imported package"
+entries = []
+for line in proc.stderr.splitlines():
+    parts = line.split("|")
+    if len(parts) != 3 or not line.startswith("import time:"):
+        continue
+    try:
+        cumulative = int(parts[1].strip())
+    except ValueError:
+        continue
+    name = parts[2].rstrip()
+    # Only top-level imports (no indentation) so nested modules aren't double counted
+    if not name.startswith("  "):
+        entries.append((cumulative, name.strip()))
+
+print(f"   - Wall time for 'import main': {elapsed:.2f}s")
+print(f"   - Full profile written to {IMPORTTIME_LOG}")
+print("   - Slowest top-level imports:")
+for cumulative, name in sorted(entries, reverse=True)[:10]:
+    print(f"     {cumulative / 1000:8.1f} ms  {name}")
+
+# Step 2: Time until /health and /ready answer
+print("\n[2/2] Measuring time to /health and /ready...")
+server_log = open(SERVER_LOG, "w")
+start = time.perf_counter()
+server = subprocess.Popen(
+    [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PORT)],
+    stdout=server_log,
+    stderr=subprocess.STDOUT
+)
+
+def wait_for(path, timeout=60):
+    while time.perf_counter() - start < timeout:
+        if server.poll() is not None:
+            print(f"   ✗ Server exited with code {server.returncode}, see {SERVER_LOG}")
+            exit(1)
+        try:
+            r = requests.get(f"{BASE_URL}{path}", timeout=1)
+            if r.status_code == 200:
+                return time.perf_counter() - start, r.json()
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.05)
+    return None, None
+
+try:
+    health_time, _ = wait_for("/health")
+    ready_time, ready_body = wait_for("/ready")
+finally:
+    if server.poll() is None:
+        server.terminate()
+        server.wait()
+    server_log.close()
+
+if health_time is None:
+    print(f"   ✗ /health did not answer in time, see {SERVER_LOG}")
+    exit(1)
+print(f"   ✓ /health ready after {health_time:.2f}s")
+
+if ready_time is None:
+    print(f"   ✗ /ready did not report ready in time, see {SERVER_LOG}")
+    exit(1)
+print(f"   ✓ /ready finished warm-up after {ready_time:.2f}s ({ready_body['status']})")
+print(f"   - Warm-up: {ready_body}")
+
+print("\n" + "=" * 60)
+print("BENCHMARK COMPLETE")
+print("=" * 60)
@@ -1,20 +1,40 @@
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from functools import lru_cache
 
 class Settings(BaseSettings):
     openrouter_api_key: str
     openrouter_model: str = "google/gemma-3-12b-it:free"
     max_file_size_mb: int = 50
     upload_dir: str = "./uploads"
-    
+    warmup_on_startup: bool = True
+
     class Config:
         env_file = ".env"
         case_sensitive = False
 
-settings = Settings()
+ALLOWED_EXTENSIONS = {'.csv', '.xlsx', '.xls', '.json', '.parquet'}
 
-UPLOAD_DIR = Path(settings.upload_dir)
-UPLOAD_DIR.mkdir(exist_ok=True)
+@lru_cache
+def get_settings() -> Settings:
+    # Settings are read from the environment/.env on first use rather than at import time
+    return Settings()
 
-ALLOWED_EXTENSIONS = {'.csv', '.xlsx', '.xls', '.json', '.parquet'}
-MAX_FILE_SIZE = settings.max_file_size_mb * 1024 * 1024
+@lru_cache
+def get_upload_dir() -> Path:
+    upload_dir = Path(get_settings().upload_dir)
+    upload_dir.mkdir(exist_ok=True)
+    return upload_dir
+
+def get_max_file_size() -> int:
+    return get_settings().max_file_size_mb * 1024 * 1024
+
+def __getattr__(name: str):
+    # Keep `from config import settings, UPLOAD_DIR, MAX_FILE_SIZE` working for scripts
+    if name == "settings":
+        return get_settings()
+    if name == "UPLOAD_DIR":
+        return get_upload_dir()
+    if name == "MAX_FILE_SIZE":
+        return get_max_file_size()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,16 +2,49 @@ from fastapi import FastAPI, UploadFile, File, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pathlib import Path
+from contextlib import asynccontextmanager
 import shutil
+import threading
+import time
 import uuid
-from typing import Optional
+from typing import Optional, Dict, Any
 import uvicorn
 
-from config import settings, UPLOAD_DIR, ALLOWED_EXTENSIONS, MAX_FILE_SIZE
+from config import get_settings, get_upload_dir, get_max_file_size, ALLOWED_EXTENSIONS
 from data_loader import DataLoader
 from ai_analyst import AIDataAnalyst
 
-app = FastAPI(title="AI Data Analyst API", version="1.0.0")
+warmup_state: Dict[str, Any] = {"ready": False, "duration_seconds": None, "steps": {}}
+
+def run_warmup():
+    global warmup_state
+    started = time.perf_counter()
+    steps = {}
+    try:
+        get_upload_dir()
+        steps["upload_dir"] = "ok"
+    except Exception as e:
+        steps["upload_dir"] = f"failed: {str(e)}"
+    steps.update(ai_analyst.warm_up())
+    
+    duration = round(time.perf_counter() - started, 3)
+    
+    # Publish the finished result with a single assignment so /ready never sees a partial state
+    warmup_state = {"ready": True, "duration_seconds": duration, "steps": steps}
+    print(f"[STARTUP] Warm-up finished in {duration}s: {steps}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global warmup_state
+    # Warm-up runs in a daemon thread so /health answers as soon as the server is listening
+    # and shutdown/reload never waits on it
+    if get_settings().warmup_on_startup:
+        threading.Thread(target=run_warmup, name="warmup", daemon=True).start()
+    else:
+        warmup_state = {"ready": True, "duration_seconds": None, "steps": {}}
+    yield
+
+app = FastAPI(title="AI Data Analyst API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +73,23 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    state = warmup_state
+    if not state["ready"]:
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    
+    content = {
+        "status": "ready",
+        "warmup_seconds": state["duration_seconds"],
+        "steps": state["steps"]
+    }
+    # A failed step is reported but doesn't make the service unready: everything it
+    # primes is also loaded lazily on first use
+    if any(result != "ok" for result in state["steps"].values()):
+        content["status"] = "degraded"
+    return content
+
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
     global current_file_path, current_df, current_df_info
@@ -55,16 +105,16 @@ async def upload_file(file: UploadFile = File(...)):
         )
     
     file_id = str(uuid.uuid4())
-    file_path = UPLOAD_DIR / f"{file_id}{file_ext}"
+    file_path = get_upload_dir() / f"{file_id}{file_ext}"
     
     try:
         with file_path.open("wb") as buffer:
             content = await file.read()
             
-            if len(content) > MAX_FILE_SIZE:
+            if len(content) > get_max_file_size():
                 raise HTTPException(
                     status_code=400,
-                    detail=f"File too large. Max size: {settings.max_file_size_mb}MB"
+                    detail=f"File too large. Max size: {get_settings().max_file_size_mb}MB"
                 )
             
             buffer.write(content)